@@ -0,0 +1,101 @@
+from reportlab.platypus import Paragraph
+
+from utils import PDFGenerator
+
+
+def section_headers(content):
+    """Return the section header texts rendered for the given content"""
+    generator = PDFGenerator()
+    generator.parse_and_add_content(content)
+    return [f.text for f in generator.story if isinstance(f, Paragraph) and f.style is generator.heading_style]
+
+
+def test_numbered_list_inside_section_is_not_a_heading():
+    content = """1. Introduction
+Intro text.
+
+2. Goals and Objectives
+1. Grow revenue
+2. Cut cost
+3. Reduce churn
+4. Improve NPS
+
+3. User Personas and Roles
+Admins and users.
+
+4. Functional Requirements
+FR01 | Login | High | -
+"""
+    sections = PDFGenerator()._split_sections(content)
+
+    assert sections['2'][0] == 'Goals and Objectives'
+    assert '4. Improve NPS' in sections['2'][1]
+    assert sections['3'] == ('User Personas and Roles', '\nAdmins and users.\n\n')
+    assert sections['4'][0] == 'Functional Requirements'
+    assert section_headers(content)[:4] == [
+        '1. Introduction',
+        '2. Goals and Objectives',
+        '3. User Personas and Roles',
+        '4. Functional Requirements',
+    ]
+
+
+def test_markdown_headings_are_sections():
+    content = """# Product Requirements Document: Acme
+## 1. Introduction
+Intro text.
+### 2. Goals and Objectives ##
+- Ship it
+**3. User Personas and Roles**
+Admins and users.
+"""
+    sections = PDFGenerator()._split_sections(content)
+
+    assert sections['1'] == ('Introduction', '\nIntro text.\n')
+    assert sections['2'] == ('Goals and Objectives', '\n- Ship it\n')
+    assert sections['3'] == ('User Personas and Roles', '\nAdmins and users.\n')
+    assert section_headers(content)[:3] == [
+        '1. Introduction',
+        '2. Goals and Objectives',
+        '3. User Personas and Roles',
+    ]
+
+    content = """1. **Introduction**
+Intro text.
+12. User Stories in C#
+As a developer I want things.
+"""
+    sections = PDFGenerator()._split_sections(content)
+
+    assert sections['1'] == ('Introduction', '\nIntro text.\n')
+    assert sections['12'] == ('User Stories in C#', '\nAs a developer I want things.\n')
+    headers = section_headers(content)
+    assert headers[0] == '1. Introduction'
+    assert headers[11] == '12. User Stories in C#'
+
+
+def test_section_bodies_are_rendered_for_markdown_headings():
+    content = """## 1. Introduction
+Intro text.
+
+## 2. Goals and Objectives
+1. Grow revenue
+2. Cut cost
+3. Reduce churn
+
+## 3. User Personas and Roles
+Admins and users.
+"""
+    generator = PDFGenerator()
+    generator.parse_and_add_content(content)
+    texts = [f.text for f in generator.story if isinstance(f, Paragraph)]
+
+    assert texts[:5] == [
+        '1. Introduction',
+        'Intro text.',
+        '2. Goals and Objectives',
+        '1. Grow revenue 2. Cut cost 3. Reduce churn',
+        '3. User Personas and Roles',
+    ]
+    assert texts[5] == 'Admins and users.'
+    assert texts[7] == 'No content provided for this section.'
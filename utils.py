@@ -1,6 +1,7 @@
 import io
 import re
 from datetime import datetime
+from itertools import groupby
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
@@ -11,9 +12,137 @@ from reportlab.platypus import (
 from reportlab.lib.enums import TA_LEFT, TA_JUSTIFY
 
 
+# Default titles for the 16 PRD sections, keyed by section number
+_DEFAULT_TITLES = {
+    '1': 'Introduction',
+    '2': 'Goals and Objectives',
+    '3': 'User Personas and Roles',
+    '4': 'Functional Requirements',
+    '5': 'Non-Functional Requirements',
+    '6': 'User Interface (UI) / User Experience (UX) Considerations',
+    '7': 'Data Requirements',
+    '8': 'System Architecture & Technical Considerations',
+    '9': 'Release Criteria & Success Metrics',
+    '10': 'Timeline & Milestones',
+    '11': 'Team Structure',
+    '12': 'User Stories',
+    '13': 'Cost Estimation',
+    '14': 'Open Issues & Future Considerations',
+    '15': 'Appendix',
+    '16': 'Points Requiring Further Clarification'
+}
+
+_PROJECT_PREFIX = "Product Requirements Document"
+
+# Regex patterns are compiled once at import time and shared by every PDFGenerator
+_SUBSECTION_RE = re.compile(r'(?<!\d)(\d+)\.(\d+)\s+(.*?)(?=(?<!\d)\d+\.\d+|\Z)', re.DOTALL)
+_SECTION_TITLE_RE = re.compile(r'(?<!\d)\d+\.\s+(.*?)(?=\n|\Z)')
+_SUBSECTION_TITLE_RE = re.compile(r'(?<!\d)\d+\.\d+\s+(.*?)(?=\n|\Z)')
+_BLOCK_SPLIT = re.compile(r'\n\s*\n')
+_BULLET_LINE = re.compile(r'^[ \t]*[-*][ \t]+\S', re.MULTILINE)
+_CONTENT_LINE = re.compile(r'^[ \t]*([-*][ \t]+)?(\S[^\n]*)', re.MULTILINE)
+_FR_ROW_RE = re.compile(r'^[ \t]*(FR[^|\n]*)\|([^|\n]*)\|([^|\n]*)\|([^|\n]*)', re.MULTILINE)
+
+# Section headings such as "1. Introduction", "## 1. Introduction" or "**1. Introduction**",
+# located in a single pass over the content. Only spaces/tabs are allowed around the
+# number so that runs of blank lines cannot make the scan quadratic
+_SECTION_ANCHOR = re.compile(r'^[ \t]*(?:#{1,6}[ \t]*)?(\*\*)?(\d{1,2})\.[ \t]+([^\n]+)$', re.MULTILINE)
+# Closing ATX markers ("## 1. Introduction ##"); the lookbehind keeps the scan linear
+_CLOSING_ATX_RE = re.compile(r'(?<![ \t])[ \t]+#+[ \t]*$')
+
+# Stylesheet and paragraph styles are built once and shared by every PDFGenerator
+_BASE_STYLES = getSampleStyleSheet()
+
+_TITLE_STYLE = ParagraphStyle(
+    'TitleStyle',
+    parent=_BASE_STYLES['Heading1'],
+    fontSize=18,
+    alignment=TA_LEFT,
+    spaceAfter=12,
+    fontName='Helvetica-Bold'
+)
+
+_SUBTITLE_STYLE = ParagraphStyle(
+    'SubtitleStyle',
+    parent=_BASE_STYLES['Heading2'],
+    fontSize=16,
+    alignment=TA_LEFT,
+    spaceAfter=12,
+    fontName='Helvetica-Bold'
+)
+
+_HEADING_STYLE = ParagraphStyle(
+    'HeadingStyle',
+    parent=_BASE_STYLES['Heading2'],
+    fontSize=14,
+    spaceBefore=18,
+    spaceAfter=6,
+    textColor=colors.black,
+    fontName='Helvetica-Bold'
+)
+
+_SUBHEADING_STYLE = ParagraphStyle(
+    'SubheadingStyle',
+    parent=_BASE_STYLES['Heading3'],
+    fontSize=12,
+    spaceBefore=12,
+    spaceAfter=6,
+    fontName='Helvetica-Bold'
+)
+
+_NORMAL_STYLE = ParagraphStyle(
+    'NormalStyle',
+    parent=_BASE_STYLES['Normal'],
+    fontSize=11,
+    spaceBefore=6,
+    spaceAfter=6,
+    alignment=TA_JUSTIFY
+)
+
+_BULLET_STYLE = ParagraphStyle(
+    'BulletStyle',
+    parent=_BASE_STYLES['Normal'],
+    fontSize=11,
+    spaceBefore=0,
+    spaceAfter=3,
+    leftIndent=20,
+    bulletIndent=10
+)
+
+_TOC_STYLE = ParagraphStyle(
+    'TOCStyle',
+    parent=_BASE_STYLES['Normal'],
+    fontSize=12,
+    spaceBefore=3,
+    spaceAfter=3,
+    fontName='Helvetica'
+)
+
+# Table.setStyle only reads the commands, so one TableStyle serves every table
+_FR_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+])
+
+# Table of contents lines; Paragraphs are still built per document because
+# wrap/split keep layout state on the flowable
+_TOC_ENTRIES = tuple(_DEFAULT_TITLES.values())
+_TOC_TEXTS = tuple(f"{i}. {entry}" for i, entry in enumerate(_TOC_ENTRIES, 1))
+
+# Headers for sections missing from the content are the same "N. Title" lines
+_SECTION_HEADER_TEXTS = _TOC_TEXTS
+
+
 class PDFGenerator:
-    def __init__(self):
-        self.buffer = io.BytesIO()
+    def __init__(self, output=None):
+        # Write straight into a caller supplied stream (file, response body) when given
+        self._owns_buffer = output is None
+        self.buffer = io.BytesIO() if output is None else output
         self.doc = SimpleDocTemplate(
             self.buffer, 
             pagesize=A4, 
@@ -22,76 +151,19 @@ class PDFGenerator:
             topMargin=72, 
             bottomMargin=72
         )
-        self.styles = getSampleStyleSheet()
+        self.styles = _BASE_STYLES
         self.story = []
         self.setup_styles()
         
     def setup_styles(self):
         """Define all the styles needed for the document"""
-        self.title_style = ParagraphStyle(
-            'TitleStyle',
-            parent=self.styles['Heading1'],
-            fontSize=18,
-            alignment=TA_LEFT,
-            spaceAfter=12,
-            fontName='Helvetica-Bold'
-        )
-        
-        self.subtitle_style = ParagraphStyle(
-            'SubtitleStyle',
-            parent=self.styles['Heading2'],
-            fontSize=16,
-            alignment=TA_LEFT,
-            spaceAfter=12,
-            fontName='Helvetica-Bold'
-        )
-        
-        self.heading_style = ParagraphStyle(
-            'HeadingStyle',
-            parent=self.styles['Heading2'],
-            fontSize=14,
-            spaceBefore=18,
-            spaceAfter=6,
-            textColor=colors.black,
-            fontName='Helvetica-Bold'
-        )
-        
-        self.subheading_style = ParagraphStyle(
-            'SubheadingStyle',
-            parent=self.styles['Heading3'],
-            fontSize=12,
-            spaceBefore=12,
-            spaceAfter=6,
-            fontName='Helvetica-Bold'
-        )
-        
-        self.normal_style = ParagraphStyle(
-            'NormalStyle',
-            parent=self.styles['Normal'],
-            fontSize=11,
-            spaceBefore=6,
-            spaceAfter=6,
-            alignment=TA_JUSTIFY
-        )
-        
-        self.bullet_style = ParagraphStyle(
-            'BulletStyle',
-            parent=self.styles['Normal'],
-            fontSize=11,
-            spaceBefore=0,
-            spaceAfter=3,
-            leftIndent=20,
-            bulletIndent=10
-        )
-        
-        self.toc_style = ParagraphStyle(
-            'TOCStyle',
-            parent=self.styles['Normal'],
-            fontSize=12,
-            spaceBefore=3,
-            spaceAfter=3,
-            fontName='Helvetica'
-        )
+        self.title_style = _TITLE_STYLE
+        self.subtitle_style = _SUBTITLE_STYLE
+        self.heading_style = _HEADING_STYLE
+        self.subheading_style = _SUBHEADING_STYLE
+        self.normal_style = _NORMAL_STYLE
+        self.bullet_style = _BULLET_STYLE
+        self.toc_style = _TOC_STYLE
         
     def create_cover_page(self, project_name):
         """Create the cover page with title and date"""
@@ -108,115 +180,103 @@ class PDFGenerator:
         self.story.append(Paragraph("Table of Contents", self.subtitle_style))
         self.story.append(Spacer(1, 0.2 * inch))
         
-        toc_entries = [
-            "Introduction",
-            "Goals and Objectives",
-            "User Personas and Roles",
-            "Functional Requirements",
-            "Non-Functional Requirements",
-            "User Interface (UI) / User Experience (UX) Considerations",
-            "Data Requirements",
-            "System Architecture & Technical Considerations",
-            "Release Criteria & Success Metrics",
-            "Timeline & Milestones",
-            "Team Structure",
-            "User Stories",
-            "Cost Estimation",
-            "Open Issues & Future Considerations",
-            "Appendix",
-            "Points Requiring Further Clarification"
-        ]
-        
-        for i, entry in enumerate(toc_entries, 1):
-            self.story.append(Paragraph(f"{i}. {entry}", self.toc_style))
+        toc_style = self.toc_style
+        self.story.extend([Paragraph(text, toc_style) for text in _TOC_TEXTS])
         
     def extract_project_name(self, content):
         """Extract the project name from the content"""
-        match = re.search(r"Product Requirements Document:?\s*([^\n]+)", content)
-        if match:
-            return match.group(1).strip()
-        else:
-            return "Project Requirements Document"
+        start = content.find(_PROJECT_PREFIX)
+        if start >= 0:
+            start += len(_PROJECT_PREFIX)
+            if content.startswith(':', start):
+                start += 1
+            # The name may be on the following line, so skip any whitespace first
+            while start < len(content) and content[start].isspace():
+                start += 1
+            end = content.find('\n', start)
+            project_name = content[start:end if end >= 0 else None].strip()
+            if project_name:
+                return project_name
+        return "Project Requirements Document"
         
-    def extract_project_name(self, content):
-        """Extract the project name from the content"""
-        match = re.search(r"Product Requirements Document:?\s*([^\n]+)", content)
-        if match:
-            return match.group(1).strip()
-        else:
-            return "Project Requirements Document"
-    
     def parse_and_add_content(self, content):
         """Parse the content and add it to the story with proper formatting"""
-        # Try to extract sections using regex pattern
-        sections = {}
+        found = self._split_sections(content)
         
-        # Look for patterns like "1. Introduction", "2. Goals and Objectives", etc.
-        for i in range(1, 17):  # We have 16 sections
-            section_title = self.get_default_section_title(str(i))
-            pattern = rf'{i}\.\s+{re.escape(section_title)}(.*?)(?={i+1}\.\s+|$)'
-            
-            match = re.search(pattern, content, re.DOTALL)
-            if match:
-                sections[str(i)] = f"{i}. {section_title}{match.group(1)}"
+        # Process each section, collecting flowables locally and adding them to the story once
+        out = []
+        heading_style = self.heading_style
+        for i, default_header in enumerate(_SECTION_HEADER_TEXTS, 1):  # We have 16 sections
+            section_num = str(i)
+            if section_num in found:
+                section_title, body = found[section_num]
+                header = f"{section_num}. {section_title}"
+                content_text = body.strip()
             else:
-                # Simplified fallback pattern
-                simple_pattern = rf'{i}\.\s+(.*?)(?={i+1}\.\s+|$)'
-                match = re.search(simple_pattern, content, re.DOTALL)
-                if match:
-                    sections[str(i)] = match.group(0)
-                else:
-                    # If section not found, create a placeholder
-                    sections[str(i)] = f"{i}. {section_title}\n\nNo content provided for this section."
-        
-        # Process each section
-        for section_num in sorted(sections.keys(), key=int):
-            section_content = sections[section_num]
-            
-            # Extract title
-            title_match = re.match(rf'{section_num}\.\s+(.*?)(?=\n|$)', section_content)
-            section_title = title_match.group(1) if title_match else self.get_default_section_title(section_num)
+                # If section not found, use a placeholder
+                header = default_header
+                content_text = "No content provided for this section."
             
             # Add section header
-            self.story.append(Paragraph(f"{section_num}. {section_title}", self.heading_style))
-            
-            # Extract content (remove the title line)
-            lines = section_content.split('\n', 1)
-            if len(lines) > 1:
-                content_text = lines[1].strip()
-                if content_text:
-                    self.add_content_with_formatting(content_text)
+            out.append(Paragraph(header, heading_style))
+            if content_text:
+                out.extend(self._format_content(content_text))
             
             # Add spacer after section
-            self.story.append(Spacer(1, 0.2 * inch))
+            out.append(Spacer(1, 0.2 * inch))
+        
+        self.story.extend(out)
                 
+    def _split_sections(self, content):
+        """Split content into {number: (title, body)} with one scan over the section headings"""
+        anchors = []
+        for match in _SECTION_ANCHOR.finditer(content):
+            section_num = int(match.group(2))
+            if 1 <= section_num <= 16:
+                title = _CLOSING_ATX_RE.sub('', match.group(3).strip())
+                # Drop the bold markers wrapping "**N. Title**" or "N. **Title**"
+                if match.group(1) and title.endswith('**'):
+                    title = title[:-2].rstrip()
+                elif len(title) > 4 and title.startswith('**') and title.endswith('**'):
+                    title = title[2:-2].strip()
+                titled = title.casefold().startswith(_DEFAULT_TITLES[str(section_num)].casefold())
+                anchors.append((match, section_num, title, titled))
+        
+        # Lowest section number among the titled headings at or after each anchor
+        next_titled = [17] * (len(anchors) + 1)
+        for idx in range(len(anchors) - 1, -1, -1):
+            _, section_num, _, titled = anchors[idx]
+            next_titled[idx] = min(next_titled[idx + 1], section_num) if titled else next_titled[idx + 1]
+        
+        # Headings must be increasing. A heading whose title is not the expected one is only
+        # accepted if no expected heading with the same or a lower number follows it;
+        # anything else is a numbered list inside a section
+        matches = []
+        last_num = 0
+        for idx, (match, section_num, title, titled) in enumerate(anchors):
+            if section_num <= last_num:
+                continue
+            if titled or next_titled[idx + 1] > section_num:
+                matches.append((match, section_num, title))
+                last_num = section_num
+        
+        sections = {}
+        for (match, section_num, title), nxt in zip(matches, matches[1:] + [None]):
+            body = content[match.end():nxt[0].start() if nxt else len(content)]
+            sections[str(section_num)] = (title, body)
+            
+        return sections
+    
     def extract_sections(self, content):
-        """Extract main sections from content using regex"""
+        """Extract main sections from content"""
         sections = {}
-        # Look for patterns like "1. Introduction", "2. Goals and Objectives", etc.
-        section_patterns = [
-            (r'1\.\s+Introduction(.*?)(?=2\.\s+Goals|$)', '1'),
-            (r'2\.\s+Goals and Objectives(.*?)(?=3\.\s+User|$)', '2'),
-            (r'3\.\s+User Personas and Roles(.*?)(?=4\.\s+Functional|$)', '3'),
-            (r'4\.\s+Functional Requirements(.*?)(?=5\.\s+Non-Functional|$)', '4'),
-            (r'5\.\s+Non-Functional Requirements(.*?)(?=6\.\s+User Interface|$)', '5'),
-            (r'6\.\s+User Interface.*?Considerations(.*?)(?=7\.\s+Data|$)', '6'),
-            (r'7\.\s+Data Requirements(.*?)(?=8\.\s+System|$)', '7'),
-            (r'8\.\s+System Architecture(.*?)(?=9\.\s+Release|$)', '8'),
-            (r'9\.\s+Release Criteria(.*?)(?=10\.\s+Timeline|$)', '9'),
-            (r'10\.\s+Timeline(.*?)(?=11\.\s+Team|$)', '10'),
-            (r'11\.\s+Team Structure(.*?)(?=12\.\s+User Stories|$)', '11'),
-            (r'12\.\s+User Stories(.*?)(?=13\.\s+Cost|$)', '12'),
-            (r'13\.\s+Cost Estimation(.*?)(?=14\.\s+Open|$)', '13'),
-            (r'14\.\s+Open Issues(.*?)(?=15\.\s+Appendix|$)', '14'),
-            (r'15\.\s+Appendix(.*?)(?=16\.\s+Points|$)', '15'),
-            (r'16\.\s+Points Requiring(.*?)$', '16'),
-        ]
+        found = self._split_sections(content)
         
-        for pattern, section_num in section_patterns:
-            match = re.search(pattern, content, re.DOTALL)
-            if match:
-                sections[section_num] = match.group(0)
+        for i in range(1, 17):
+            section_num = str(i)
+            if section_num in found:
+                section_title, body = found[section_num]
+                sections[section_num] = f"{section_num}. {section_title}{body}"
             else:
                 # If section not found, create a placeholder
                 sections[section_num] = f"{section_num}. {self.get_default_section_title(section_num)}"
@@ -225,33 +285,14 @@ class PDFGenerator:
     
     def get_default_section_title(self, section_num):
         """Get default section title if not found"""
-        titles = {
-            '1': 'Introduction',
-            '2': 'Goals and Objectives',
-            '3': 'User Personas and Roles',
-            '4': 'Functional Requirements',
-            '5': 'Non-Functional Requirements',
-            '6': 'User Interface (UI) / User Experience (UX) Considerations',
-            '7': 'Data Requirements',
-            '8': 'System Architecture & Technical Considerations',
-            '9': 'Release Criteria & Success Metrics',
-            '10': 'Timeline & Milestones',
-            '11': 'Team Structure',
-            '12': 'User Stories',
-            '13': 'Cost Estimation',
-            '14': 'Open Issues & Future Considerations',
-            '15': 'Appendix',
-            '16': 'Points Requiring Further Clarification'
-        }
-        return titles.get(section_num, f"Section {section_num}")
+        return _DEFAULT_TITLES.get(section_num, f"Section {section_num}")
             
     def extract_subsections(self, section_content):
         """Extract subsections from a section content"""
         subsections = {}
         
         # Look for patterns like "1.1 Purpose", "1.2 Scope", etc.
-        subsection_pattern = r'(\d+)\.(\d+)\s+(.*?)(?=\d+\.\d+|\Z)'
-        matches = re.finditer(subsection_pattern, section_content, re.DOTALL)
+        matches = _SUBSECTION_RE.finditer(section_content)
         
         for match in matches:
             section_num = match.group(1)
@@ -263,8 +304,7 @@ class PDFGenerator:
     
     def get_section_title(self, section_num, content):
         """Extract the title of a section"""
-        pattern = r'\d+\.\s+(.*?)(?=\n|\Z)'
-        match = re.search(pattern, content)
+        match = _SECTION_TITLE_RE.search(content)
         if match:
             return match.group(1).strip()
         else:
@@ -272,104 +312,61 @@ class PDFGenerator:
     
     def get_subsection_title(self, subsection_num, content):
         """Extract the title of a subsection"""
-        pattern = r'\d+\.\d+\s+(.*?)(?=\n|\Z)'
-        match = re.search(pattern, content)
+        match = _SUBSECTION_TITLE_RE.search(content)
         if match:
             return match.group(1).strip()
         else:
             return f"Subsection {subsection_num}"
     
+    def _strip_title_line(self, content):
+        """Return everything after the first (title) line"""
+        lines = content.split('\n', 1)
+        if len(lines) > 1:
+            return lines[1].strip()
+        return ""
+    
     def clean_section_content(self, content):
         """Remove the section title from content"""
-        pattern = r'\d+\.\s+.*?\n(.*)'
-        match = re.search(pattern, content, re.DOTALL)
-        if match:
-            return match.group(1).strip()
-        else:
-            # If we can't find the pattern, just return everything after the first line
-            lines = content.split('\n', 1)
-            if len(lines) > 1:
-                return lines[1].strip()
-            return ""
+        return self._strip_title_line(content)
     
     def clean_subsection_content(self, content):
         """Remove the subsection title from content"""
-        pattern = r'\d+\.\d+\s+.*?\n(.*)'
-        match = re.search(pattern, content, re.DOTALL)
-        if match:
-            return match.group(1).strip()
-        else:
-            # If we can't find the pattern, just return everything after the first line
-            lines = content.split('\n', 1)
-            if len(lines) > 1:
-                return lines[1].strip()
-            return ""
+        return self._strip_title_line(content)
     
     def add_content_with_formatting(self, content):
         """Process and add content with proper formatting"""
-        # Check if this is a bullet list
-        if re.search(r'^\s*[\-\*]\s', content, re.MULTILINE):
-            items = []
-            paragraphs = []
+        self.story.extend(self._format_content(content))
+    
+    def _format_content(self, content):
+        """Build the paragraph and bullet list flowables for a block of content"""
+        out = []
+        normal_style = self.normal_style
+        bullet_style = self.bullet_style
+        
+        # Blocks are separated by blank lines; a block with bullet lines becomes bullet lists
+        # interleaved with one paragraph per plain line, any other block is a single paragraph
+        for block in _BLOCK_SPLIT.split(content):
+            if not _BULLET_LINE.search(block):
+                if block.strip():
+                    out.append(Paragraph(block.strip(), normal_style))
+                continue
             
-            for line in content.split('\n'):
-                line = line.strip()
-                if not line:
-                    continue
-                    
-                if line.startswith('-') or line.startswith('*'):
-                    # If we had normal paragraphs before, add them
-                    if paragraphs:
-                        for p in paragraphs:
-                            self.story.append(Paragraph(p, self.normal_style))
-                        paragraphs = []
-                    
-                    # Add bullet item
-                    bullet_text = line[1:].strip()
-                    items.append(ListItem(Paragraph(bullet_text, self.bullet_style)))
+            for is_bullet, lines in groupby(_CONTENT_LINE.finditer(block), key=lambda m: m.group(1) is not None):
+                if is_bullet:
+                    items = [ListItem(Paragraph(m.group(2).rstrip(), bullet_style)) for m in lines]
+                    out.append(ListFlowable(items, bulletType='bullet', start=None))
                 else:
-                    # If we had bullet items before, add them
-                    if items:
-                        self.story.append(ListFlowable(items, bulletType='bullet', start=None))
-                        items = []
-                    
-                    # Collect normal paragraph text
-                    paragraphs.append(line)
-            
-            # Add any remaining items
-            if items:
-                self.story.append(ListFlowable(items, bulletType='bullet', start=None))
-            
-            # Add any remaining paragraphs
-            if paragraphs:
-                for p in paragraphs:
-                    self.story.append(Paragraph(p, self.normal_style))
-        else:
-            # Process normal paragraphs
-            paragraphs = content.split('\n\n')
-            for p in paragraphs:
-                if p.strip():
-                    self.story.append(Paragraph(p.strip(), self.normal_style))
+                    out.extend(Paragraph(m.group(2).rstrip(), normal_style) for m in lines)
+        
+        return out
     
     def add_functional_requirements_table(self, content):
         """Parse and add a table for functional requirements"""
         # Simple table extraction - in a real implementation, you'd want more robust parsing
-        rows = []
         header_row = ['ID', 'Requirement Description', 'Priority', 'Dependencies']
-        rows.append(header_row)
         
-        # Extract table rows
-        lines = content.split('\n')
-        for line in lines:
-            line = line.strip()
-            if line.startswith("FR") and "|" in line:
-                # It's a table row
-                cells = [cell.strip() for cell in line.split('|')]
-                if len(cells) >= 4:
-                    rows.append(cells[:4])  # Take the first 4 cells
-            elif line.startswith("ID") and "|" in line:
-                # Skip the header row as we've already added it
-                continue
+        # Extract table rows (first four cells of every "FR.. | .. | .. | .." line)
+        rows = [header_row] + [[cell.strip() for cell in m.groups()] for m in _FR_ROW_RE.finditer(content)]
         
         # If we found no data rows, add a placeholder
         if len(rows) == 1:
@@ -377,15 +374,7 @@ class PDFGenerator:
         
         # Create the table
         table = Table(rows, repeatRows=1)
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ]))
+        table.setStyle(_FR_TABLE_STYLE)
         
         self.story.append(table)
     
@@ -409,6 +398,23 @@ class PDFGenerator:
         # Build the PDF
         self.doc.build(self.story)
         
-        # Reset buffer position to the beginning
-        self.buffer.seek(0)
+        # Reset buffer position to the beginning of our own buffer
+        if self._owns_buffer:
+            self.buffer.seek(0)
         return self.buffer
+
+
+def _generate_one(content):
+    """Generate a single PDF in a worker process and return its bytes"""
+    return PDFGenerator().generate(content).getvalue()
+
+
+def generate_many(contents, max_workers=None):
+    """Generate one PDF per content string in parallel worker processes"""
+    # Imported here so that single-document callers never load multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    
+    # ReportLab is pure Python and CPU bound, so use processes rather than threads;
+    # only the content strings and the resulting bytes cross the process boundary
+    with ProcessPoolExecutor(max_workers) as executor:
+        return list(executor.map(_generate_one, contents))